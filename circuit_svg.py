@@ -0,0 +1,193 @@
+"""Symbol geometry and static SVG markup for the circuit diagram
+
+Kept out of the Streamlit script so the templates, symbol definitions and
+frame are computed once per process rather than on every rerun.
+"""
+import math
+
+import numpy as np
+
+from component_params import COMPONENTS
+
+
+def _arrow_template(x, y, dx, dy, head=0.02):
+    """Shaft and triangular head vertices of an arrow from (x, y) along (dx, dy)"""
+    start = np.array([x, y])
+    end = start + (dx, dy)
+    unit = np.array([dx, dy]) / math.hypot(dx, dy)
+    normal = np.array([-unit[1], unit[0]])
+    shaft = np.array([start, end])
+    arrowhead = np.array([end + unit*head, end + normal*head/2, end - normal*head/2])
+    return shaft, arrowhead
+
+# Shape-invariant symbol geometry centred on the origin; the shared SVG
+# symbol definitions are built from these
+_AC_SINE_T = np.linspace(-np.pi, np.pi, 50)
+SYMBOL_TEMPLATES = {
+    "zigzag": (np.linspace(-0.3, 0.3, 7), 0.1 * np.array([0, 1, -1, 1, -1, 1, 0])),
+    "ac_sine": (0.1 * _AC_SINE_T / np.pi, 0.08 * np.sin(2*_AC_SINE_T)),
+    "inductor_coils": np.array([-0.15, -0.05, 0.05, 0.15]),
+    "led_rays": (_arrow_template(0.1, -0.15, 0.05, -0.05), _arrow_template(0.15, -0.1, 0.05, -0.05)),
+    "emitter_arrow": (_arrow_template(0.05, -0.15, 0.03, -0.03),)
+}
+
+# SVG canvas: the plot area spans data x in [-1, 10] and y in [-1, 6]
+SVG_SCALE = 80  # pixels per data unit
+SVG_PT = 1.3  # pixels per point, for stroke widths and font sizes
+_SVG_LEFT, _SVG_TOP, _SVG_RIGHT, _SVG_BOTTOM = 60, 50, 30, 55
+_SVG_WIDTH = _SVG_LEFT + 11 * SVG_SCALE + _SVG_RIGHT
+_SVG_HEIGHT = _SVG_TOP + 7 * SVG_SCALE + _SVG_BOTTOM
+
+def svg_point(x, y):
+    """Map a data-space position to canvas pixels"""
+    return _SVG_LEFT + (x + 1) * SVG_SCALE, _SVG_TOP + (6 - y) * SVG_SCALE
+
+def _svg_line(xs, ys, color='black', linewidth=1):
+    """Polyline through symbol-local data offsets"""
+    points = " ".join(f"{x*SVG_SCALE:.1f},{-y*SVG_SCALE:.1f}" for x, y in zip(xs, ys))
+    return (f'<polyline points="{points}" fill="none" stroke="{color}" '
+            f'stroke-width="{linewidth*SVG_PT:.1f}"/>')
+
+def _svg_circle(x, y, r, color, linewidth=2, fill='none'):
+    """Circle at a symbol-local data offset"""
+    return (f'<circle cx="{x*SVG_SCALE:.1f}" cy="{-y*SVG_SCALE:.1f}" r="{r*SVG_SCALE:.1f}" '
+            f'fill="{fill}" stroke="{color}" stroke-width="{linewidth*SVG_PT:.1f}"/>')
+
+def svg_circles(centers, r):
+    """Path data drawing every circle in centers (pixels) as one element"""
+    return "".join(f"M{cx - r:.1f},{cy:.1f}a{r:.1f},{r:.1f} 0 1,0 {2*r:.1f},0"
+                   f"a{r:.1f},{r:.1f} 0 1,0 {-2*r:.1f},0" for cx, cy in centers)
+
+def _svg_polygon(vertices, color):
+    """Filled polygon through symbol-local data offsets"""
+    points = " ".join(f"{x*SVG_SCALE:.1f},{-y*SVG_SCALE:.1f}" for x, y in vertices)
+    return f'<polygon points="{points}" fill="{color}" stroke="{color}"/>'
+
+def _svg_arrows(arrows, color):
+    """Every (shaft, arrowhead) template in arrows as a single path element"""
+    d = []
+    for shaft, arrowhead in arrows:
+        for vertices, close in ((shaft, ''), (arrowhead, 'Z')):
+            d.append("M" + "L".join(f"{x*SVG_SCALE:.1f},{-y*SVG_SCALE:.1f}" for x, y in vertices) + close)
+    return (f'<path d="{"".join(d)}" fill="{color}" stroke="{color}" '
+            f'stroke-width="{SVG_PT:.1f}"/>')
+
+def svg_text(x, y, text, fontsize=8, bold=False, middle=False):
+    """Centred text label at an absolute canvas position"""
+    weight = ' font-weight="bold"' if bold else ''
+    baseline = ' dominant-baseline="central"' if middle else ''
+    return (f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle" '
+            f'font-size="{fontsize*SVG_PT:.1f}"{weight}{baseline}>{text}</text>')
+
+def _build_svg_symbols():
+    """One <symbol> per symbol kind, drawn around the origin"""
+    color = {info["symbol"]: info["color"] for info in COMPONENTS.values()}
+    
+    def stubs(inner, outer=0.3):
+        # Connection lines either side of the symbol body
+        return _svg_line([-outer, -inner], [0, 0]) + _svg_line([inner, outer], [0, 0])
+    
+    zigzag_x, zigzag_y = SYMBOL_TEMPLATES['zigzag']
+    sine_x, sine_y = SYMBOL_TEMPLATES['ac_sine']
+    coils = svg_circles([(offset*SVG_SCALE, 0) for offset in SYMBOL_TEMPLATES['inductor_coils']],
+                         0.05*SVG_SCALE)
+    
+    symbols = {
+        "zigzag": _svg_line(zigzag_x, zigzag_y, color["zigzag"], 2) + stubs(0.3, 0.5),
+        "capacitor": (
+            _svg_line([-0.05, -0.05], [-0.2, 0.2], color["capacitor"], 3)
+            + _svg_line([0.05, 0.05], [-0.2, 0.2], color["capacitor"], 3)
+            + stubs(0.05)
+        ),
+        "inductor": (
+            f'<path d="{coils}" fill="none" stroke="{color["inductor"]}" '
+            f'stroke-width="{2*SVG_PT:.1f}"/>'
+            + stubs(0.2)
+        ),
+        "diode": (
+            _svg_polygon([(-0.1, -0.1), (-0.1, 0.1), (0.05, 0)], color["diode"])
+            + _svg_line([0.05, 0.05], [-0.15, 0.15], color["diode"], 3)
+            + _svg_line([-0.3, -0.1], [0, 0]) + _svg_line([0.05, 0.3], [0, 0])
+        ),
+        "led": (
+            _svg_polygon([(-0.1, -0.1), (-0.1, 0.1), (0.05, 0)], color["led"])
+            + _svg_line([0.05, 0.05], [-0.15, 0.15], color["led"], 3)
+            + _svg_arrows(SYMBOL_TEMPLATES['led_rays'], color["led"])
+            + _svg_line([-0.3, -0.1], [0, 0]) + _svg_line([0.05, 0.3], [0, 0])
+        ),
+        "transistor_npn": (
+            _svg_line([-0.1, -0.1], [-0.2, 0.2], color["transistor_npn"], 3)
+            + _svg_line([-0.1, 0.1], [0.05, 0.2], color["transistor_npn"], 2)
+            + _svg_line([-0.1, 0.1], [-0.05, -0.2], color["transistor_npn"], 2)
+            + _svg_arrows(SYMBOL_TEMPLATES['emitter_arrow'], 'black')
+            + _svg_line([-0.3, -0.1], [0, 0])
+            + _svg_line([0.1, 0.3], [0.2, 0.2])
+            + _svg_line([0.1, 0.3], [-0.2, -0.2])
+        ),
+        "battery": (
+            _svg_line([-0.05, -0.05], [-0.2, 0.2], color["battery"], 4)
+            + _svg_line([0.05, 0.05], [-0.15, 0.15], color["battery"], 2)
+            + stubs(0.05)
+        ),
+        "ac_source": (
+            _svg_circle(0, 0, 0.15, color["ac_source"])
+            + _svg_line(sine_x, sine_y, color["ac_source"], 1)
+            + stubs(0.15)
+        ),
+        "ground": (
+            _svg_line([0, 0], [0, -0.15], color["ground"], 2)
+            + _svg_line([-0.15, 0.15], [-0.15, -0.15], color["ground"], 3)
+            + _svg_line([-0.1, 0.1], [-0.2, -0.2], color["ground"], 2)
+            + _svg_line([-0.05, 0.05], [-0.25, -0.25], color["ground"], 1)
+        ),
+        "ammeter": _svg_circle(0, 0, 0.15, color["ammeter"]) + stubs(0.15),
+        "voltmeter": _svg_circle(0, 0, 0.15, color["voltmeter"]) + stubs(0.15),
+        "load": (
+            f'<rect x="{-0.1*SVG_SCALE:.1f}" y="{-0.08*SVG_SCALE:.1f}" '
+            f'width="{0.2*SVG_SCALE:.1f}" height="{0.16*SVG_SCALE:.1f}" fill="none" '
+            f'stroke="{color["load"]}" stroke-width="{2*SVG_PT:.1f}"/>'
+            + stubs(0.1)
+        )
+    }
+    # The switch blade depends on its state, so each state gets a symbol
+    contacts = f'<path d="{svg_circles([(-0.1*SVG_SCALE, 0), (0.1*SVG_SCALE, 0)], 0.02*SVG_SCALE)}"/>'
+    symbols["switch_open"] = (stubs(0.1) + _svg_line([-0.1, 0.05], [0, 0.1], color["switch"], 2)
+                              + contacts)
+    symbols["switch_closed"] = (stubs(0.1) + _svg_line([-0.1, 0.1], [0, 0], color["switch"], 2)
+                                + contacts)
+    
+    return "".join(f'<symbol id="{name}" overflow="visible">{markup}</symbol>'
+                   for name, markup in symbols.items())
+
+def _build_svg_frame():
+    """Static title, grid, axes and tick labels around the plot area"""
+    left, top = svg_point(-1, 6)
+    right, bottom = svg_point(10, -1)
+    # Every grid line goes into one path so the grid is a single element
+    grid = []
+    parts = []
+    for x in range(0, 11, 2):
+        px, _ = svg_point(x, 0)
+        grid.append(f"M{px:.1f},{top:.1f}V{bottom:.1f}")
+        parts.append(svg_text(px, bottom + 18, str(x), 10))
+    for y in range(-1, 7):
+        _, py = svg_point(0, y)
+        grid.append(f"M{left:.1f},{py:.1f}H{right:.1f}")
+        parts.append(svg_text(left - 14, py, str(y), 10, middle=True))
+    parts.insert(0, f'<path d="{"".join(grid)}" fill="none" stroke="#b0b0b0" stroke-opacity="0.3"/>')
+    parts.append(f'<rect x="{left:.1f}" y="{top:.1f}" width="{right-left:.1f}" '
+                 f'height="{bottom-top:.1f}" fill="none" stroke="black"/>')
+    parts.append(svg_text((left + right) / 2, top - 14, 'Circuit Diagram', 16, bold=True))
+    parts.append(svg_text((left + right) / 2, bottom + 40, 'X Position', 10))
+    parts.append(f'<text transform="translate({left - 38:.1f},{(top + bottom) / 2:.1f}) rotate(-90)" '
+                 f'text-anchor="middle" font-size="{10*SVG_PT:.1f}">Y Position</text>')
+    return "".join(parts)
+
+# Document head shared by every render: canvas, symbol defs and frame
+SVG_HEADER = (
+    f'<svg xmlns="http://www.w3.org/2000/svg" width="{_SVG_WIDTH}" height="{_SVG_HEIGHT}" '
+    f'viewBox="0 0 {_SVG_WIDTH} {_SVG_HEIGHT}" font-family="DejaVu Sans, Arial, sans-serif">'
+    f'<rect width="100%" height="100%" fill="white"/>'
+    f'<defs>{_build_svg_symbols()}</defs>'
+    f'{_build_svg_frame()}'
+)
@@ -0,0 +1,187 @@
+"""Parameter records, catalogue and edit schema for workbench components
+
+Kept out of the Streamlit script so these are built once per process:
+the script body is re-executed on every rerun, imported modules are not.
+"""
+from dataclasses import dataclass, fields
+
+
+# Per-type parameter records; slot-backed fields instead of dict lookups
+@dataclass(slots=True)
+class ResistorParams:
+    resistance: float = 1000.0
+    power_rating: float = 0.25
+    tolerance: float = 5.0
+
+@dataclass(slots=True)
+class CapacitorParams:
+    capacitance: float = 100e-6
+    voltage_rating: float = 25.0
+    type: str = "Ceramic"
+
+@dataclass(slots=True)
+class InductorParams:
+    inductance: float = 1e-3
+    current_rating: float = 1.0
+    resistance: float = 0.1
+
+@dataclass(slots=True)
+class DiodeParams:
+    forward_voltage: float = 0.7
+    max_current: float = 1.0
+    reverse_voltage: float = 50.0
+
+@dataclass(slots=True)
+class LEDParams:
+    forward_voltage: float = 2.0
+    forward_current: float = 0.02
+    color: str = "Red"
+
+@dataclass(slots=True)
+class TransistorParams:
+    beta: float = 100.0
+    vbe: float = 0.7
+    vce_sat: float = 0.2
+
+@dataclass(slots=True)
+class BatteryParams:
+    voltage: float = 9.0
+    capacity: float = 1000.0
+    internal_resistance: float = 0.1
+
+@dataclass(slots=True)
+class ACSourceParams:
+    voltage_rms: float = 120.0
+    frequency: float = 50.0
+    phase: float = 0.0
+
+@dataclass(slots=True)
+class GroundParams:
+    pass
+
+@dataclass(slots=True)
+class SwitchParams:
+    state: str = "Open"
+    contact_resistance: float = 0.01
+
+@dataclass(slots=True)
+class AmmeterParams:
+    range: float = 1.0
+    reading: float = 0.0
+    accuracy: float = 1.0
+
+@dataclass(slots=True)
+class VoltmeterParams:
+    range: float = 10.0
+    reading: float = 0.0
+    accuracy: float = 1.0
+
+@dataclass(slots=True)
+class LoadParams:
+    power: float = 100.0
+    voltage: float = 12.0
+    type: str = "Resistive"
+
+def param_items(params):
+    """(name, value) pairs of a parameter record, in declaration order"""
+    return [(f.name, getattr(params, f.name)) for f in fields(params)]
+
+# Enhanced components with electrical symbols and parameters
+COMPONENTS = {
+    "Resistor": {
+        "symbol": "zigzag", 
+        "factory": ResistorParams, 
+        "units": {"resistance": "Ω", "power_rating": "W", "tolerance": "%"},
+        "color": "brown"
+    },
+    "Capacitor": {
+        "symbol": "capacitor", 
+        "factory": CapacitorParams, 
+        "units": {"capacitance": "F", "voltage_rating": "V", "type": ""},
+        "color": "blue"
+    },
+    "Inductor": {
+        "symbol": "inductor", 
+        "factory": InductorParams, 
+        "units": {"inductance": "H", "current_rating": "A", "resistance": "Ω"},
+        "color": "green"
+    },
+    "Diode": {
+        "symbol": "diode", 
+        "factory": DiodeParams, 
+        "units": {"forward_voltage": "V", "max_current": "A", "reverse_voltage": "V"},
+        "color": "red"
+    },
+    "LED": {
+        "symbol": "led", 
+        "factory": LEDParams, 
+        "units": {"forward_voltage": "V", "forward_current": "A", "color": ""},
+        "color": "orange"
+    },
+    "Transistor (NPN)": {
+        "symbol": "transistor_npn", 
+        "factory": TransistorParams, 
+        "units": {"beta": "", "vbe": "V", "vce_sat": "V"},
+        "color": "purple"
+    },
+    "Battery": {
+        "symbol": "battery", 
+        "factory": BatteryParams, 
+        "units": {"voltage": "V", "capacity": "mAh", "internal_resistance": "Ω"},
+        "color": "black"
+    },
+    "AC Source": {
+        "symbol": "ac_source", 
+        "factory": ACSourceParams, 
+        "units": {"voltage_rms": "V", "frequency": "Hz", "phase": "°"},
+        "color": "cyan"
+    },
+    "Ground": {
+        "symbol": "ground", 
+        "factory": GroundParams, 
+        "units": {},
+        "color": "gray"
+    },
+    "Switch": {
+        "symbol": "switch", 
+        "factory": SwitchParams, 
+        "units": {"state": "", "contact_resistance": "Ω"},
+        "color": "yellow"
+    },
+    "Ammeter": {
+        "symbol": "ammeter", 
+        "factory": AmmeterParams, 
+        "units": {"range": "A", "reading": "A", "accuracy": "%"},
+        "color": "darkgreen"
+    },
+    "Voltmeter": {
+        "symbol": "voltmeter", 
+        "factory": VoltmeterParams, 
+        "units": {"range": "V", "reading": "V", "accuracy": "%"},
+        "color": "darkblue"
+    },
+    "Load": {
+        "symbol": "load", 
+        "factory": LoadParams, 
+        "units": {"power": "W", "voltage": "V", "type": ""},
+        "color": "maroon"
+    }
+}
+
+def _widget_kind(default):
+    """Input widget used to edit a parameter with this default value"""
+    if isinstance(default, str):
+        return 'text'
+    if isinstance(default, bool):
+        return 'bool'
+    return 'number'
+
+# Per-type (param, label, unit, widget kind) rows, flattened once per
+# process so the edit panel and analysis view only look them up
+PARAM_SCHEMA = {
+    comp_type: tuple(
+        (f.name, f.name.replace('_', ' ').title(), info['units'].get(f.name, ''), _widget_kind(f.default))
+        for f in fields(info['factory'])
+    )
+    for comp_type, info in COMPONENTS.items()
+}
@@ -1,14 +1,9 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, Rectangle, Polygon
-import io
-import json
 from datetime import datetime
-import random
-import math
+from dataclasses import replace
+from component_params import COMPONENTS, PARAM_SCHEMA, param_items
+from circuit_svg import SVG_HEADER, SVG_PT, SVG_SCALE, svg_circles, svg_point, svg_text
 
 # Page configuration
 st.set_page_config(
@@ -18,88 +13,58 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enhanced components with electrical symbols and parameters
-COMPONENTS = {
-    "Resistor": {
-        "symbol": "zigzag", 
-        "params": {"resistance": 1000.0, "power_rating": 0.25, "tolerance": 5.0}, 
-        "units": {"resistance": "Ω", "power_rating": "W", "tolerance": "%"},
-        "color": "brown"
-    },
-    "Capacitor": {
-        "symbol": "capacitor", 
-        "params": {"capacitance": 100e-6, "voltage_rating": 25.0, "type": "Ceramic"}, 
-        "units": {"capacitance": "F", "voltage_rating": "V", "type": ""},
-        "color": "blue"
-    },
-    "Inductor": {
-        "symbol": "inductor", 
-        "params": {"inductance": 1e-3, "current_rating": 1.0, "resistance": 0.1}, 
-        "units": {"inductance": "H", "current_rating": "A", "resistance": "Ω"},
-        "color": "green"
-    },
-    "Diode": {
-        "symbol": "diode", 
-        "params": {"forward_voltage": 0.7, "max_current": 1.0, "reverse_voltage": 50.0}, 
-        "units": {"forward_voltage": "V", "max_current": "A", "reverse_voltage": "V"},
-        "color": "red"
-    },
-    "LED": {
-        "symbol": "led", 
-        "params": {"forward_voltage": 2.0, "forward_current": 0.02, "color": "Red"}, 
-        "units": {"forward_voltage": "V", "forward_current": "A", "color": ""},
-        "color": "orange"
-    },
-    "Transistor (NPN)": {
-        "symbol": "transistor_npn", 
-        "params": {"beta": 100.0, "vbe": 0.7, "vce_sat": 0.2}, 
-        "units": {"beta": "", "vbe": "V", "vce_sat": "V"},
-        "color": "purple"
-    },
-    "Battery": {
-        "symbol": "battery", 
-        "params": {"voltage": 9.0, "capacity": 1000.0, "internal_resistance": 0.1}, 
-        "units": {"voltage": "V", "capacity": "mAh", "internal_resistance": "Ω"},
-        "color": "black"
-    },
-    "AC Source": {
-        "symbol": "ac_source", 
-        "params": {"voltage_rms": 120.0, "frequency": 50.0, "phase": 0.0}, 
-        "units": {"voltage_rms": "V", "frequency": "Hz", "phase": "°"},
-        "color": "cyan"
-    },
-    "Ground": {
-        "symbol": "ground", 
-        "params": {}, 
-        "units": {},
-        "color": "gray"
-    },
-    "Switch": {
-        "symbol": "switch", 
-        "params": {"state": "Open", "contact_resistance": 0.01}, 
-        "units": {"state": "", "contact_resistance": "Ω"},
-        "color": "yellow"
-    },
-    "Ammeter": {
-        "symbol": "ammeter", 
-        "params": {"range": 1.0, "reading": 0.0, "accuracy": 1.0}, 
-        "units": {"range": "A", "reading": "A", "accuracy": "%"},
-        "color": "darkgreen"
-    },
-    "Voltmeter": {
-        "symbol": "voltmeter", 
-        "params": {"range": 10.0, "reading": 0.0, "accuracy": 1.0}, 
-        "units": {"range": "V", "reading": "V", "accuracy": "%"},
-        "color": "darkblue"
-    },
-    "Load": {
-        "symbol": "load", 
-        "params": {"power": 100.0, "voltage": 12.0, "type": "Resistive"}, 
-        "units": {"power": "W", "voltage": "V", "type": ""},
-        "color": "maroon"
-    }
+# Numeric parameters mirrored into per-field NumPy arrays for analysis,
+# with the value used when a component type lacks the parameter
+ARRAY_FIELDS = {
+    "resistance": 0.0,
+    "capacitance": 0.0,
+    "voltage_rating": 0.0,
+    "inductance": 0.0,
+    "current_rating": 0.0,
+    "voltage": 0.0,
+    "voltage_rms": 0.0,
+    "internal_resistance": 1.0,
+    "power": 0.0
 }
 
+# Integer type codes, assigned when a component is added, so analysis
+# masks are integer comparisons rather than string comparisons
+TYPE_CODES = {comp_type: code for code, comp_type in enumerate(COMPONENTS)}
+RESISTOR = TYPE_CODES["Resistor"]
+CAPACITOR = TYPE_CODES["Capacitor"]
+INDUCTOR = TYPE_CODES["Inductor"]
+BATTERY = TYPE_CODES["Battery"]
+AC_SOURCE = TYPE_CODES["AC Source"]
+LOAD = TYPE_CODES["Load"]
+
+# Angular frequency used for the 60 Hz reactance figures
+_TWO_PI_60 = 2.0 * np.pi * 60.0
+
+def empty_component_arrays():
+    """Structure-of-arrays store parallel to circuit_components"""
+    arrays = {field: np.empty(0) for field in ARRAY_FIELDS}
+    arrays['type_code'] = np.empty(0, dtype=np.int64)
+    arrays['id'] = np.empty(0, dtype=np.int64)
+    arrays['x'] = np.empty(0)
+    arrays['y'] = np.empty(0)
+    return arrays
+
+def append_component_arrays(comp):
+    """Add a new component's slot to the SoA store"""
+    arrays = st.session_state.component_arrays
+    arrays['type_code'] = np.append(arrays['type_code'], TYPE_CODES[comp['type']])
+    arrays['id'] = np.append(arrays['id'], comp['id'])
+    arrays['x'] = np.append(arrays['x'], comp['x'])
+    arrays['y'] = np.append(arrays['y'], comp['y'])
+    for field, default in ARRAY_FIELDS.items():
+        arrays[field] = np.append(arrays[field], float(getattr(comp['params'], field, default)))
+
+def update_component_arrays(index, comp):
+    """Refresh an existing slot of the SoA store after a parameter edit"""
+    arrays = st.session_state.component_arrays
+    for field, default in ARRAY_FIELDS.items():
+        arrays[field][index] = float(getattr(comp['params'], field, default))
+
 # Initialize session state
 if 'circuit_components' not in st.session_state:
     st.session_state.circuit_components = []
@@ -109,197 +74,163 @@ if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = {}
 if 'component_counter' not in st.session_state:
     st.session_state.component_counter = 0
+if 'component_arrays' not in st.session_state:
+    st.session_state.component_arrays = empty_component_arrays()
+if 'component_index' not in st.session_state:
+    st.session_state.component_index = {}
+# Selectbox labels for every component and the label -> id map behind them,
+# kept in step with circuit_components so pickers don't rebuild them
+if 'comp_labels' not in st.session_state:
+    st.session_state.comp_labels = []
+if 'comp_label_ids' not in st.session_state:
+    st.session_state.comp_label_ids = {}
 
-def create_component_symbol(ax, comp_type, x, y, comp_id, params):
-    """Draw electrical symbols on matplotlib axis"""
+def component_labels(comp_type, x, y, comp_id, params):
+    """Text labels for a component; the only per-component drawing besides its <use>"""
     symbol_type = COMPONENTS[comp_type]["symbol"]
-    color = COMPONENTS[comp_type]["color"]
+    
+    def text(dx, dy, label, fontsize=8, bold=False, middle=False):
+        px, py = svg_point(x + dx, y + dy)
+        return svg_text(px, py, label, fontsize, bold, middle)
+    
+    labels = [text(0, 0.35, f"{comp_type} ({comp_id})", bold=True)]
     
     if symbol_type == "zigzag":  # Resistor
-        # Zigzag pattern
-        zigzag_x = np.linspace(x-0.3, x+0.3, 7)
-        zigzag_y = y + 0.1 * np.array([0, 1, -1, 1, -1, 1, 0])
-        ax.plot(zigzag_x, zigzag_y, color=color, linewidth=2)
-        # Connection lines
-        ax.plot([x-0.5, x-0.3], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.3, x+0.5], [y, y], color='black', linewidth=1)
-        # Add resistance value
-        ax.text(x, y-0.2, f"{params.get('resistance', 0):.0f}Ω", ha='center', fontsize=8)
-        
+        labels.append(text(0, -0.2, f"{params.resistance:.0f}Ω"))
+    
     elif symbol_type == "capacitor":  # Capacitor
-        # Two parallel lines
-        ax.plot([x-0.05, x-0.05], [y-0.2, y+0.2], color=color, linewidth=3)
-        ax.plot([x+0.05, x+0.05], [y-0.2, y+0.2], color=color, linewidth=3)
-        # Connection lines
-        ax.plot([x-0.3, x-0.05], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.05, x+0.3], [y, y], color='black', linewidth=1)
-        # Add capacitance value
-        cap_val = params.get('capacitance', 0)
+        cap_val = params.capacitance
         if cap_val >= 1e-6:
-            ax.text(x, y-0.2, f"{cap_val*1e6:.0f}µF", ha='center', fontsize=8)
+            labels.append(text(0, -0.2, f"{cap_val*1e6:.0f}µF"))
         else:
-            ax.text(x, y-0.2, f"{cap_val*1e9:.0f}nF", ha='center', fontsize=8)
+            labels.append(text(0, -0.2, f"{cap_val*1e9:.0f}nF"))
     
     elif symbol_type == "inductor":  # Inductor
-        # Coil representation using arcs
-        for i in range(4):
-            circle = Circle((x-0.15+i*0.1, y), 0.05, fill=False, color=color, linewidth=2)
-            circle.set_clip_box(ax.bbox)
-            ax.add_patch(circle)
-        # Connection lines
-        ax.plot([x-0.3, x-0.2], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.2, x+0.3], [y, y], color='black', linewidth=1)
-        # Add inductance value
-        ind_val = params.get('inductance', 0)
+        ind_val = params.inductance
         if ind_val >= 1e-3:
-            ax.text(x, y-0.2, f"{ind_val*1e3:.0f}mH", ha='center', fontsize=8)
+            labels.append(text(0, -0.2, f"{ind_val*1e3:.0f}mH"))
         else:
-            ax.text(x, y-0.2, f"{ind_val*1e6:.0f}µH", ha='center', fontsize=8)
-    
-    elif symbol_type == "diode":  # Diode
-        # Triangle and line
-        triangle = Polygon([(x-0.1, y-0.1), (x-0.1, y+0.1), (x+0.05, y)], 
-                          closed=True, fill=True, color=color)
-        ax.add_patch(triangle)
-        ax.plot([x+0.05, x+0.05], [y-0.15, y+0.15], color=color, linewidth=3)
-        # Connection lines
-        ax.plot([x-0.3, x-0.1], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.05, x+0.3], [y, y], color='black', linewidth=1)
-    
-    elif symbol_type == "led":  # LED
-        # Diode with arrows
-        triangle = Polygon([(x-0.1, y-0.1), (x-0.1, y+0.1), (x+0.05, y)], 
-                          closed=True, fill=True, color=color)
-        ax.add_patch(triangle)
-        ax.plot([x+0.05, x+0.05], [y-0.15, y+0.15], color=color, linewidth=3)
-        # LED arrows
-        ax.arrow(x+0.1, y-0.15, 0.05, -0.05, head_width=0.02, head_length=0.02, fc=color, ec=color)
-        ax.arrow(x+0.15, y-0.1, 0.05, -0.05, head_width=0.02, head_length=0.02, fc=color, ec=color)
-        # Connection lines
-        ax.plot([x-0.3, x-0.1], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.05, x+0.3], [y, y], color='black', linewidth=1)
-    
-    elif symbol_type == "transistor_npn":  # NPN Transistor
-        # Base line
-        ax.plot([x-0.1, x-0.1], [y-0.2, y+0.2], color=color, linewidth=3)
-        # Collector and emitter lines
-        ax.plot([x-0.1, x+0.1], [y+0.05, y+0.2], color=color, linewidth=2)
-        ax.plot([x-0.1, x+0.1], [y-0.05, y-0.2], color=color, linewidth=2)
-        # Arrow on emitter
-        ax.arrow(x+0.05, y-0.15, 0.03, -0.03, head_width=0.02, head_length=0.02, fc='black', ec='black')
-        # Connection points
-        ax.plot([x-0.3, x-0.1], [y, y], color='black', linewidth=1)  # Base
-        ax.plot([x+0.1, x+0.3], [y+0.2, y+0.2], color='black', linewidth=1)  # Collector
-        ax.plot([x+0.1, x+0.3], [y-0.2, y-0.2], color='black', linewidth=1)  # Emitter
+            labels.append(text(0, -0.2, f"{ind_val*1e6:.0f}µH"))
     
     elif symbol_type == "battery":  # Battery
-        # Long and short lines
-        ax.plot([x-0.05, x-0.05], [y-0.2, y+0.2], color=color, linewidth=4)
-        ax.plot([x+0.05, x+0.05], [y-0.15, y+0.15], color=color, linewidth=2)
-        # Connection lines
-        ax.plot([x-0.3, x-0.05], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.05, x+0.3], [y, y], color='black', linewidth=1)
-        # Voltage label
-        ax.text(x, y-0.3, f"{params.get('voltage', 0):.1f}V", ha='center', fontsize=8)
+        labels.append(text(0, -0.3, f"{params.voltage:.1f}V"))
         # Polarity marks
-        ax.text(x-0.05, y+0.25, '+', ha='center', fontsize=10, weight='bold')
-        ax.text(x+0.05, y+0.25, '-', ha='center', fontsize=10, weight='bold')
+        labels.append(text(-0.05, 0.25, '+', 10, bold=True))
+        labels.append(text(0.05, 0.25, '-', 10, bold=True))
     
     elif symbol_type == "ac_source":  # AC Source
-        # Circle
-        circle = Circle((x, y), 0.15, fill=False, color=color, linewidth=2)
-        ax.add_patch(circle)
-        # Sine wave inside
-        t = np.linspace(-np.pi, np.pi, 50)
-        sine_x = x + 0.1 * t / np.pi
-        sine_y = y + 0.08 * np.sin(2*t)
-        ax.plot(sine_x, sine_y, color=color, linewidth=1)
-        # Connection lines
-        ax.plot([x-0.3, x-0.15], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.15, x+0.3], [y, y], color='black', linewidth=1)
-        # Voltage and frequency labels
-        ax.text(x, y-0.3, f"{params.get('voltage_rms', 0):.0f}V", ha='center', fontsize=8)
-        ax.text(x, y-0.4, f"{params.get('frequency', 0):.0f}Hz", ha='center', fontsize=8)
-    
-    elif symbol_type == "ground":  # Ground
-        ax.plot([x, x], [y, y-0.15], color=color, linewidth=2)
-        ax.plot([x-0.15, x+0.15], [y-0.15, y-0.15], color=color, linewidth=3)
-        ax.plot([x-0.1, x+0.1], [y-0.2, y-0.2], color=color, linewidth=2)
-        ax.plot([x-0.05, x+0.05], [y-0.25, y-0.25], color=color, linewidth=1)
-    
-    elif symbol_type == "switch":  # Switch
-        # Connection points
-        ax.plot([x-0.3, x-0.1], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.1, x+0.3], [y, y], color='black', linewidth=1)
-        # Switch blade
-        if params.get("state") == "Open":
-            ax.plot([x-0.1, x+0.05], [y, y+0.1], color=color, linewidth=2)
-        else:
-            ax.plot([x-0.1, x+0.1], [y, y], color=color, linewidth=2)
-        # Contact points
-        contact1 = Circle((x-0.1, y), 0.02, fill=True, color='black')
-        contact2 = Circle((x+0.1, y), 0.02, fill=True, color='black')
-        ax.add_patch(contact1)
-        ax.add_patch(contact2)
+        labels.append(text(0, -0.3, f"{params.voltage_rms:.0f}V"))
+        labels.append(text(0, -0.4, f"{params.frequency:.0f}Hz"))
     
     elif symbol_type in ["ammeter", "voltmeter"]:  # Meters
-        # Circle
-        circle = Circle((x, y), 0.15, fill=False, color=color, linewidth=2)
-        ax.add_patch(circle)
-        # Letter inside
         letter = "A" if symbol_type == "ammeter" else "V"
-        ax.text(x, y, letter, ha='center', va='center', fontsize=12, weight='bold')
-        # Connection lines
-        ax.plot([x-0.3, x-0.15], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.15, x+0.3], [y, y], color='black', linewidth=1)
-        # Reading
-        reading = params.get('reading', 0)
-        ax.text(x, y-0.25, f"{reading:.3f}{letter}", ha='center', fontsize=8)
+        labels.append(text(0, 0, letter, 12, bold=True, middle=True))
+        labels.append(text(0, -0.25, f"{params.reading:.3f}{letter}"))
     
     elif symbol_type == "load":  # Load
-        # Rectangle
-        rect = Rectangle((x-0.1, y-0.08), 0.2, 0.16, fill=False, color=color, linewidth=2)
-        ax.add_patch(rect)
-        ax.text(x, y, 'LOAD', ha='center', va='center', fontsize=8, weight='bold')
-        # Connection lines
-        ax.plot([x-0.3, x-0.1], [y, y], color='black', linewidth=1)
-        ax.plot([x+0.1, x+0.3], [y, y], color='black', linewidth=1)
-        # Power rating
-        ax.text(x, y-0.2, f"{params.get('power', 0):.0f}W", ha='center', fontsize=8)
+        labels.append(text(0, 0, 'LOAD', bold=True, middle=True))
+        labels.append(text(0, -0.2, f"{params.power:.0f}W"))
     
-    # Add component label
-    ax.text(x, y+0.35, f"{comp_type} ({comp_id})", ha='center', fontsize=8, weight='bold')
+    return labels
+
+@st.cache_data(max_entries=32)
+def _render_circuit_svg(components, connections):
+    """Render the circuit diagram to SVG markup, cached on the circuit state
+    
+    The cache is shared across sessions, so the body works only from its
+    arguments and the module-level SVG constants, never session_state.
+    """
+    parts = [SVG_HEADER]
+    labels = []
+    
+    # Draw components, one <use> of the shared symbol each
+    positions = {}
+    for comp_id, comp_type, x, y, params in components:
+        params = COMPONENTS[comp_type]['factory'](**dict(params))
+        symbol_type = COMPONENTS[comp_type]["symbol"]
+        if symbol_type == "switch":
+            symbol_type += "_open" if params.state == "Open" else "_closed"
+        px, py = svg_point(x, y)
+        parts.append(f'<use href="#{symbol_type}" x="{px:.1f}" y="{py:.1f}"/>')
+        labels.extend(component_labels(comp_type, x, y, comp_id, params))
+        positions[comp_id] = (x, y)
+    
+    # Draw connections as a single path, then the connection points
+    if connections:
+        wires = []
+        endpoints = []
+        for from_id, to_id in connections:
+            x1, y1 = svg_point(positions[from_id][0] + 0.3, positions[from_id][1])
+            x2, y2 = svg_point(positions[to_id][0] - 0.3, positions[to_id][1])
+            wires.append(f"M{x1:.1f},{y1:.1f}L{x2:.1f},{y2:.1f}")
+            endpoints.append((x1, y1))
+            endpoints.append((x2, y2))
+        parts.append(f'<path d="{"".join(wires)}" fill="none" stroke="red" '
+                     f'stroke-width="{2*SVG_PT:.1f}" stroke-opacity="0.7"/>')
+        parts.append(f'<path d="{svg_circles(endpoints, 0.03*SVG_SCALE)}" fill="red"/>')
+    
+    parts.extend(labels)
+    parts.append('</svg>')
+    return "".join(parts)
 
 def draw_circuit():
-    """Draw the complete circuit diagram"""
-    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-    ax.set_xlim(-1, 10)
-    ax.set_ylim(-1, 6)
-    ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
-    ax.set_title('Circuit Diagram', fontsize=16, weight='bold')
+    """Draw the complete circuit diagram as SVG markup"""
+    # Hashable snapshot of everything the diagram depends on, so reruns
+    # that leave the circuit untouched are served from the cache
+    components = tuple(
+        (c['id'], c['type'], c['x'], c['y'], tuple(param_items(c['params'])))
+        for c in st.session_state.circuit_components
+    )
+    connections = tuple(
+        (conn['from_comp'], conn['to_comp']) for conn in st.session_state.connections
+    )
+    return _render_circuit_svg(components, connections)
+
+def _analyze(type_codes, resistance, capacitance, inductance, voltage_rating,
+             current_rating, voltage, voltage_rms, internal_resistance, power):
+    """Array kernel behind calculate_circuit_parameters
     
-    # Draw components
-    for comp in st.session_state.circuit_components:
-        create_component_symbol(ax, comp['type'], comp['x'], comp['y'], comp['id'], comp['params'])
+    Takes the SoA columns positionally and returns plain tuples of arrays
+    and scalars: the circuit totals, then the derived per-component values.
+    Each result is a vectorized NumPy expression over every slot; the
+    caller sets the floating-point error state.
+    """
+    is_resistor = type_codes == RESISTOR
+    is_capacitor = type_codes == CAPACITOR
+    is_inductor = type_codes == INDUCTOR
+    is_source = (type_codes == BATTERY) | (type_codes == AC_SOURCE)
+    is_load = type_codes == LOAD
     
-    # Draw connections
-    for conn in st.session_state.connections:
-        comp1 = next(c for c in st.session_state.circuit_components if c['id'] == conn['from_comp'])
-        comp2 = next(c for c in st.session_state.circuit_components if c['id'] == conn['to_comp'])
-        
-        # Simple straight line connection
-        ax.plot([comp1['x']+0.3, comp2['x']-0.3], [comp1['y'], comp2['y']], 
-               color='red', linewidth=2, alpha=0.7)
-        
-        # Add connection points
-        ax.plot(comp1['x']+0.3, comp1['y'], 'ro', markersize=4)
-        ax.plot(comp2['x']-0.3, comp2['y'], 'ro', markersize=4)
+    source_voltage = np.where(voltage != 0, voltage, voltage_rms)
+    totals = (
+        resistance[is_resistor].sum(),
+        capacitance[is_capacitor & (capacitance > 0)].sum(),
+        inductance[is_inductor].sum(),
+        source_voltage[is_source],
+        power[is_load].sum()
+    )
     
-    ax.set_xlabel('X Position')
-    ax.set_ylabel('Y Position')
+    current = 0.001  # Assume 1mA for demonstration
+    load_current = power / voltage
+    derived = (
+        current**2 * resistance,
+        current * resistance,
+        0.5 * capacitance * voltage_rating**2,
+        np.where(capacitance > 0, 1.0 / (_TWO_PI_60 * capacitance), np.inf),
+        0.5 * inductance * current_rating**2,
+        _TWO_PI_60 * inductance,
+        source_voltage**2 / internal_resistance,
+        load_current,
+        np.where(load_current > 0, voltage / load_current, np.inf)
+    )
     
-    return fig
+    return totals, derived
+
+# Names of the per-component arrays returned by _analyze, in order
+_DERIVED_FIELDS = (
+    'power_dissipated', 'voltage_drop', 'cap_energy', 'cap_reactance', 'ind_energy',
+    'ind_reactance', 'max_power', 'load_current', 'load_resistance'
+)
 
 def calculate_circuit_parameters():
     """Perform basic circuit analysis"""
@@ -312,60 +243,61 @@ def calculate_circuit_parameters():
         'component_analysis': []
     }
     
+    arrays = st.session_state.component_arrays
+    type_codes = arrays['type_code']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        totals, derived = _analyze(
+            type_codes, arrays['resistance'], arrays['capacitance'], arrays['inductance'],
+            arrays['voltage_rating'], arrays['current_rating'], arrays['voltage'],
+            arrays['voltage_rms'], arrays['internal_resistance'], arrays['power']
+        )
+    total_resistance, total_capacitance, total_inductance, source_voltages, power_consumption = totals
+    results.update({
+        'total_resistance': float(total_resistance),
+        'total_capacitance': float(total_capacitance),
+        'total_inductance': float(total_inductance),
+        'voltage_sources': source_voltages.tolist(),
+        'power_consumption': float(power_consumption)
+    })
+    derived = dict(zip(_DERIVED_FIELDS, derived))
+    
     # Analyze each component
-    for comp in st.session_state.circuit_components:
+    for i, comp in enumerate(st.session_state.circuit_components):
         comp_analysis = {
             'id': comp['id'],
             'type': comp['type'],
-            'parameters': comp['params'].copy()
+            'parameters': replace(comp['params'])
         }
         
-        if comp['type'] == 'Resistor':
-            resistance = comp['params'].get('resistance', 0)
-            results['total_resistance'] += resistance
-            # Calculate power dissipation (assuming some current)
-            current = 0.001  # Assume 1mA for demonstration
-            power = current**2 * resistance
+        code = type_codes[i]
+        if code == RESISTOR:
             comp_analysis['calculated'] = {
-                'power_dissipated': power,
-                'voltage_drop': current * resistance
+                'power_dissipated': float(derived['power_dissipated'][i]),
+                'voltage_drop': float(derived['voltage_drop'][i])
             }
         
-        elif comp['type'] == 'Capacitor':
-            capacitance = comp['params'].get('capacitance', 0)
-            if capacitance > 0:
-                results['total_capacitance'] += capacitance
+        elif code == CAPACITOR:
             comp_analysis['calculated'] = {
-                'energy_stored': 0.5 * capacitance * (comp['params'].get('voltage_rating', 0)**2),
-                'reactance_60hz': 1/(2*np.pi*60*capacitance) if capacitance > 0 else float('inf')
+                'energy_stored': float(derived['cap_energy'][i]),
+                'reactance_60hz': float(derived['cap_reactance'][i])
             }
         
-        elif comp['type'] == 'Inductor':
-            inductance = comp['params'].get('inductance', 0)
-            results['total_inductance'] += inductance
+        elif code == INDUCTOR:
             comp_analysis['calculated'] = {
-                'energy_stored': 0.5 * inductance * (comp['params'].get('current_rating', 0)**2),
-                'reactance_60hz': 2*np.pi*60*inductance
+                'energy_stored': float(derived['ind_energy'][i]),
+                'reactance_60hz': float(derived['ind_reactance'][i])
             }
         
-        elif comp['type'] in ['Battery', 'AC Source']:
-            voltage = comp['params'].get('voltage', 0) or comp['params'].get('voltage_rms', 0)
-            results['voltage_sources'].append(voltage)
+        elif code in (BATTERY, AC_SOURCE):
             comp_analysis['calculated'] = {
-                'max_power': voltage**2 / comp['params'].get('internal_resistance', 1)
+                'max_power': float(derived['max_power'][i])
             }
         
-        elif comp['type'] == 'Load':
-            power = comp['params'].get('power', 0)
-            results['power_consumption'] += power
-            voltage = comp['params'].get('voltage', 0)
-            if voltage > 0:
-                current = power / voltage
-                resistance = voltage / current if current > 0 else float('inf')
-                comp_analysis['calculated'] = {
-                    'current': current,
-                    'resistance': resistance
-                }
+        elif code == LOAD and arrays['voltage'][i] > 0:
+            comp_analysis['calculated'] = {
+                'current': float(derived['load_current'][i]),
+                'resistance': float(derived['load_resistance'][i])
+            }
         
         results['component_analysis'].append(comp_analysis)
     
@@ -378,6 +310,70 @@ def calculate_circuit_parameters():
     
     return results
 
+def build_csv_report():
+    """CSV report of the circuit, assembled one column array at a time"""
+    import pandas as pd
+    
+    components = st.session_state.circuit_components
+    arrays = st.session_state.component_arrays
+    type_codes = arrays['type_code']
+    count = len(type_codes)
+    
+    cols = {
+        'Component_ID': arrays['id'],
+        'Component_Type': np.array(list(COMPONENTS), dtype=object)[type_codes],
+        'X_Position': arrays['x'],
+        'Y_Position': arrays['y']
+    }
+    
+    # Parameter columns, filled for every component of a type at once;
+    # types are visited in order of first appearance in the circuit
+    type_names = list(COMPONENTS)
+    for code in dict.fromkeys(type_codes.tolist()):
+        comp_type = type_names[code]
+        rows = np.flatnonzero(type_codes == code)
+        for param, label, unit, kind in PARAM_SCHEMA[comp_type]:
+            name = f'{param}_{unit}'.replace(' ', '_')
+            if name not in cols:
+                if kind == 'number':
+                    cols[name] = np.full(count, np.nan)
+                else:
+                    cols[name] = np.full(count, None, dtype=object)
+            if param in ARRAY_FIELDS:
+                cols[name][rows] = arrays[param][rows]
+            else:
+                cols[name][rows] = [getattr(components[i]['params'], param) for i in rows]
+    
+    # Add calculated values if analysis was performed
+    if st.session_state.analysis_results:
+        for comp_analysis in st.session_state.analysis_results['component_analysis']:
+            # Ids restart after a clear, so a stale entry can name a
+            # different component; only fill rows whose type still matches
+            index = st.session_state.component_index.get(comp_analysis['id'])
+            if index is None or components[index]['type'] != comp_analysis['type']:
+                continue
+            for calc, value in comp_analysis.get('calculated', {}).items():
+                name = f'calculated_{calc}'
+                if name not in cols:
+                    cols[name] = np.full(count, np.nan)
+                cols[name][index] = value
+    
+    return pd.DataFrame(cols).to_csv(index=False).encode('utf-8')
+
+def param_widget_key(component, param):
+    """Session-state key of the edit widget for one parameter of a component"""
+    return f"param_{component['id']}_{param}"
+
+def apply_param_edits(comp_index):
+    """Update button callback; runs before the rerun so the diagram and
+    analysis already see the new parameters"""
+    component = st.session_state.circuit_components[comp_index]
+    new_params = {param: st.session_state[param_widget_key(component, param)]
+                  for param, label, unit, kind in PARAM_SCHEMA[component['type']]}
+    component['params'] = replace(component['params'], **new_params)
+    update_component_arrays(comp_index, component)
+    st.toast("Parameters updated!")
+
 def main():
     st.title("🔧 Enhanced Electronics Workbench")
     st.markdown("### Circuit Analysis Tool for Electrical Engineering Students")
@@ -403,9 +399,14 @@ def main():
                 'type': selected_component,
                 'x': x_pos,
                 'y': y_pos,
-                'params': COMPONENTS[selected_component]['params'].copy()
+                'params': COMPONENTS[selected_component]['factory']()
             }
+            st.session_state.component_index[new_component['id']] = len(st.session_state.circuit_components)
+            label = f"{selected_component} ({new_component['id']})"
+            st.session_state.comp_labels.append(label)
+            st.session_state.comp_label_ids[label] = new_component['id']
             st.session_state.circuit_components.append(new_component)
+            append_component_arrays(new_component)
             st.success(f"Added {selected_component} to circuit!")
         
         st.divider()
@@ -413,13 +414,12 @@ def main():
         # Connection section
         st.subheader("Create Connections")
         if len(st.session_state.circuit_components) >= 2:
-            comp_options = [f"{c['type']} ({c['id']})" for c in st.session_state.circuit_components]
-            from_comp = st.selectbox("From Component:", comp_options, key="from_comp")
-            to_comp = st.selectbox("To Component:", comp_options, key="to_comp")
+            from_comp = st.selectbox("From Component:", st.session_state.comp_labels, key="from_comp")
+            to_comp = st.selectbox("To Component:", st.session_state.comp_labels, key="to_comp")
             
             if st.button("🔌 Connect Components"):
-                from_id = int(from_comp.split('(')[1].split(')')[0])
-                to_id = int(to_comp.split('(')[1].split(')')[0])
+                from_id = st.session_state.comp_label_ids[from_comp]
+                to_id = st.session_state.comp_label_ids[to_comp]
                 
                 if from_id != to_id:
                     connection = {'from_comp': from_id, 'to_comp': to_id}
@@ -441,6 +441,11 @@ def main():
             st.session_state.circuit_components = []
             st.session_state.connections = []
             st.session_state.component_counter = 0
+            st.session_state.component_arrays = empty_component_arrays()
+            st.session_state.component_index = {}
+            st.session_state.comp_labels = []
+            st.session_state.comp_label_ids = {}
+            st.session_state.analysis_results = {}
             st.success("Circuit cleared!")
         
         if st.button("🔍 Analyze Circuit"):
@@ -456,9 +461,7 @@ def main():
     with col1:
         st.subheader("Circuit Diagram")
         if st.session_state.circuit_components:
-            fig = draw_circuit()
-            st.pyplot(fig)
-            plt.close()  # Prevent memory issues
+            st.image(draw_circuit(), width="stretch")
         else:
             st.info("Add components to see the circuit diagram")
         
@@ -467,36 +470,34 @@ def main():
             st.subheader("Component Parameters")
             selected_comp_for_edit = st.selectbox(
                 "Select component to edit:",
-                [f"{c['type']} ({c['id']})" for c in st.session_state.circuit_components],
+                st.session_state.comp_labels,
                 key="edit_comp"
             )
             
             if selected_comp_for_edit:
-                comp_id = int(selected_comp_for_edit.split('(')[1].split(')')[0])
-                component = next(c for c in st.session_state.circuit_components if c['id'] == comp_id)
+                comp_index = st.session_state.component_index[st.session_state.comp_label_ids[selected_comp_for_edit]]
+                component = st.session_state.circuit_components[comp_index]
                 
                 st.write(f"Editing: **{component['type']} ({component['id']})**")
                 
                 # Create input fields for each parameter
-                new_params = {}
-                for param, value in component['params'].items():
-                    unit = COMPONENTS[component['type']]['units'].get(param, '')
+                for param, label, unit, kind in PARAM_SCHEMA[component['type']]:
+                    value = getattr(component['params'], param)
+                    key = param_widget_key(component, param)
                     
-                    if isinstance(value, str):
-                        new_params[param] = st.text_input(f"{param.replace('_', ' ').title()}", value=value)
-                    elif isinstance(value, bool):
-                        new_params[param] = st.checkbox(f"{param.replace('_', ' ').title()}", value=value)
+                    if kind == 'text':
+                        st.text_input(label, value=value, key=key)
+                    elif kind == 'bool':
+                        st.checkbox(label, value=value, key=key)
                     else:
-                        new_params[param] = st.number_input(
-                            f"{param.replace('_', ' ').title()} ({unit})",
+                        st.number_input(
+                            f"{label} ({unit})",
                             value=float(value),
-                            format="%.6f"
+                            format="%.6f",
+                            key=key
                         )
                 
-                if st.button("💾 Update Parameters"):
-                    component['params'] = new_params
-                    st.success("Parameters updated!")
-                    st.experimental_rerun()
+                st.button("💾 Update Parameters", on_click=apply_param_edits, args=(comp_index,))
     
     with col2:
         st.subheader("Circuit Analysis")
@@ -524,12 +525,12 @@ def main():
                     
                     # Parameters
                     st.write("Parameters:")
-                    for param, value in comp_data['parameters'].items():
-                        unit = COMPONENTS[comp_data['type']]['units'].get(param, '')
+                    for param, label, unit, kind in PARAM_SCHEMA[comp_data['type']]:
+                        value = getattr(comp_data['parameters'], param)
                         if isinstance(value, float):
-                            st.write(f"  - {param.replace('_', ' ').title()}: {value:.6f} {unit}")
+                            st.write(f"  - {label}: {value:.6f} {unit}")
                         else:
-                            st.write(f"  - {param.replace('_', ' ').title()}: {value} {unit}")
+                            st.write(f"  - {label}: {value} {unit}")
                     
                     # Calculated values
                     if 'calculated' in comp_data:
@@ -547,23 +548,11 @@ def main():
         
         if st.button("📊 Generate CSV Report"):
             if st.session_state.circuit_components:
-                # Prepare data for CSV
-                csv_data = []
-                
-                # Component data
-                for comp in st.session_state.circuit_components:
-                    row = {
-                        'Component_ID': comp['id'],
-                        'Component_Type': comp['type'],
-                        'X_Position': comp['x'],
-                        'Y_Position': comp['y']
-                    }
-                    
-                    # Add parameters
-                    for param, value in comp['params'].items():
-                        unit = COMPONENTS[comp['type']]['units'].get(param, '')
-                        row[f'{param}_{unit}'.replace(' ', '_')] = value
-                    
-                    # Add calculated values if analysis was performed
-                    if st.session_state.analysis_results:
-                        comp_analysis = next(ca for ca in st.session_state.analysis_results['component_analysis']) 
\ No newline at end of file
+                st.download_button(
+                    "📥 Download CSV",
+                    build_csv_report(),
+                    file_name=f"circuit_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv"
+                )
+            else:
+                st.error("Add components to export!")